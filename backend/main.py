@@ -1,20 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import math
 import time
 import json
+import logging
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Dict, Tuple, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, Tuple, List, Optional, Set
 
 import numpy as np
 from fastapi import FastAPI
 from fastapi.responses import StreamingResponse
 
-from scipy.optimize import curve_fit
+from scipy.optimize import curve_fit, least_squares
 
-from qiskit import QuantumCircuit
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Delay
 from qiskit_aer import AerSimulator
-from qiskit_aer.noise import NoiseModel, ReadoutError, depolarizing_error, thermal_relaxation_error
+from qiskit_aer.noise import NoiseModel, ReadoutError, RelaxationNoisePass, depolarizing_error, thermal_relaxation_error
+
+logger = logging.getLogger(__name__)
 
 def exp_decay(t, a, T, c):
     return a * np.exp(-t / T) + c
@@ -22,6 +37,46 @@ def exp_decay(t, a, T, c):
 def damped_cos(t, a, T2, w, phi, c):
     return a * np.exp(-t / T2) * np.cos(w * t + phi) + c
 
+def exp_decay_jac(t, a, T, c):
+    e = np.exp(-t / T)
+    return np.column_stack([e, a * t / T ** 2 * e, np.ones_like(t)])
+
+def damped_cos_jac(t, a, T2, w, phi, c):
+    e = np.exp(-t / T2)
+    cos = np.cos(w * t + phi)
+    sin = np.sin(w * t + phi)
+    return np.column_stack([e * cos, a * t / T2 ** 2 * e * cos, -a * e * t * sin, -a * e * sin, np.ones_like(t)])
+
+def fit_least_squares(model, jac, t: np.ndarray, y: np.ndarray, p0, max_nfev: int, bounds=(-np.inf, np.inf)) -> np.ndarray:
+    res = least_squares(
+        lambda p: model(t, *p) - y,
+        p0,
+        jac=lambda p: jac(t, *p),
+        bounds=bounds,
+        method="trf",
+        max_nfev=max_nfev,
+    )
+    if not res.success:
+        raise RuntimeError(res.message)
+    return res.x
+
+def fit_exp_decay_loglinear(t: np.ndarray, y: np.ndarray, n_offsets: int = 16) -> Tuple[float, float, float]:
+    # closed-form fit of a * exp(-t / T) + c: for a grid of offsets c below min(y),
+    # regress log(y - c) on t and keep the offset with the smallest residual
+    cs = np.linspace(0.0, 0.9 * float(y.min()), n_offsets)
+    slope, intercept = np.polyfit(t, np.log(y[:, None] - cs[None, :]), 1)
+    model = np.exp(intercept[None, :] + np.outer(t, slope)) + cs[None, :]
+    k = int(np.argmin(((model - y[:, None]) ** 2).sum(axis=0)))
+    T = -1.0 / slope[k] if slope[k] < 0 else np.nan
+    return float(np.exp(intercept[k])), float(T), float(cs[k])
+
+def dominant_angular_freq(t: np.ndarray, y: np.ndarray, n_grid: int = 64, n_fft: int = 1024) -> float:
+    grid = np.linspace(t[0], t[-1], n_grid)
+    yi = np.interp(grid, t, y) - y.mean()
+    spec = np.abs(np.fft.rfft(yi, n=n_fft))
+    freqs = np.fft.rfftfreq(n_fft, d=grid[1] - grid[0])
+    return float(2 * math.pi * freqs[1 + int(np.argmax(spec[1:]))])
+
 @dataclass
 class HWState:
     T1_us: float
@@ -40,6 +95,9 @@ class HWState:
     start_ts: float
 
 
+rng = np.random.default_rng()
+
+
 def clamp(x, lo, hi):
     return max(lo, min(hi, x))
 
@@ -59,44 +117,96 @@ def init_state() -> HWState:
     )
 
 
-def step_state(s: HWState, dt_s: float = 2.0) -> HWState:
-    rng = np.random.default_rng()
+# order of the HWState fields in the array handed to the jitted step kernel
+HW_FIELDS = ("T1_us", "T2_us", "p1q", "p2q", "p0to1", "p1to0", "temp_K", "vibration", "em")
+
+
+@njit(cache=True)
+def clamp_nb(x, lo, hi):
+    return max(lo, min(hi, x))
 
-    spike = rng.random() < 0.05
-    s.temp_K = clamp(s.temp_K + rng.normal(0, 0.0004) + (0.010 if spike and rng.random() < 0.25 else 0.0), 0.008, 0.050)
-    s.vibration = clamp(s.vibration + rng.normal(0, 0.08) + (1.2 if spike and rng.random() < 0.20 else 0.0), 0.0, 3.0)
-    s.em = clamp(s.em + rng.normal(0, 0.09) + (1.2 if spike and rng.random() < 0.20 else 0.0), 0.0, 3.0)
 
-    temp_pressure = clamp((s.temp_K - 0.012) / 0.020, 0.0, 1.5)
-    vib_pressure = clamp(s.vibration / 2.5, 0.0, 1.2)
-    em_pressure = clamp(s.em / 2.5, 0.0, 1.2)
+@njit(cache=True)
+def _step_state_nb(x, n, u):
+    spike = u[0] < 0.05
+    temp_K = clamp_nb(x[6] + 0.0004 * n[0] + (0.010 if spike and u[1] < 0.25 else 0.0), 0.008, 0.050)
+    vibration = clamp_nb(x[7] + 0.08 * n[1] + (1.2 if spike and u[2] < 0.20 else 0.0), 0.0, 3.0)
+    em = clamp_nb(x[8] + 0.09 * n[2] + (1.2 if spike and u[3] < 0.20 else 0.0), 0.0, 3.0)
+
+    temp_pressure = clamp_nb((temp_K - 0.012) / 0.020, 0.0, 1.5)
+    vib_pressure = clamp_nb(vibration / 2.5, 0.0, 1.2)
+    em_pressure = clamp_nb(em / 2.5, 0.0, 1.2)
     pressure = 0.45 * temp_pressure + 0.275 * vib_pressure + 0.275 * em_pressure
 
-    dT1 = rng.normal(0.0, 0.25) - 0.9 * pressure
-    dT2 = rng.normal(0.0, 0.20) - 0.7 * pressure
+    dT1 = 0.25 * n[3] - 0.9 * pressure
+    dT2 = 0.20 * n[4] - 0.7 * pressure
+
+    T1_us = clamp_nb(x[0] + dT1, 20.0, 140.0)
+    x[0] = T1_us
+    x[1] = clamp_nb(x[1] + dT2, 12.0, min(120.0, T1_us * 0.95))
 
-    s.T1_us = clamp(s.T1_us + dT1, 20.0, 140.0)
-    s.T2_us = clamp(s.T2_us + dT2, 12.0, min(120.0, s.T1_us * 0.95))
+    x[2] = clamp_nb(x[2] * (1.0 + 0.02 * pressure) + 0.00003 * n[5], 0.0002, 0.006)
+    x[3] = clamp_nb(x[3] * (1.0 + 0.03 * pressure) + 0.00018 * n[6], 0.001, 0.06)
 
-    s.p1q = clamp(s.p1q * (1.0 + 0.02 * pressure) + rng.normal(0, 0.00003), 0.0002, 0.006)
-    s.p2q = clamp(s.p2q * (1.0 + 0.03 * pressure) + rng.normal(0, 0.00018), 0.001, 0.06)
+    x[4] = clamp_nb(x[4] * (1.0 + 0.04 * (vib_pressure + em_pressure)) + 0.0002 * n[7], 0.002, 0.12)
+    x[5] = clamp_nb(x[5] * (1.0 + 0.04 * (vib_pressure + em_pressure)) + 0.0002 * n[8], 0.002, 0.12)
 
-    s.p0to1 = clamp(s.p0to1 * (1.0 + 0.04 * (vib_pressure + em_pressure)) + rng.normal(0, 0.0002), 0.002, 0.12)
-    s.p1to0 = clamp(s.p1to0 * (1.0 + 0.04 * (vib_pressure + em_pressure)) + rng.normal(0, 0.0002), 0.002, 0.12)
+    x[6] = temp_K
+    x[7] = vibration
+    x[8] = em
 
+
+def step_state(s: HWState, dt_s: float = 2.0) -> HWState:
+    x = np.array([getattr(s, f) for f in HW_FIELDS], dtype=np.float64)
+    _step_state_nb(x, rng.standard_normal(9), rng.random(4))
+    for f, v in zip(HW_FIELDS, x):
+        setattr(s, f, float(v))
     return s
 
-def build_noise_model(s: HWState) -> NoiseModel:
+
+# compile the kernel at import so the first stream tick doesn't pay for it
+_step_state_nb(np.array([getattr(init_state(), f) for f in HW_FIELDS], dtype=np.float64), np.zeros(9), np.ones(4))
+
+NoiseKey = Tuple[float, float, float, float, float, float]
+
+# hardware params that stay within these tolerances of a cached key reuse its gate/readout
+# simulator; the delay relaxation that T1/Ramsey measure is always built from the exact T1/T2
+NOISE_TOL_US = 0.5
+NOISE_REL_TOL = 0.02
+NOISE_CACHE_SIZE = 8
+
+recent_noise_keys: List[NoiseKey] = []
+
+
+def noise_keys_close(a: NoiseKey, b: NoiseKey) -> bool:
+    if abs(a[0] - b[0]) > NOISE_TOL_US or abs(a[1] - b[1]) > NOISE_TOL_US:
+        return False
+    return all(abs(x - y) <= NOISE_REL_TOL * y for x, y in zip(a[2:], b[2:]))
+
+
+def noise_key(s: HWState) -> NoiseKey:
+    params = tuple(float(v) for v in (s.T1_us, s.T2_us, s.p1q, s.p2q, s.p0to1, s.p1to0))
+    for i, key in enumerate(recent_noise_keys):
+        if noise_keys_close(params, key):
+            recent_noise_keys.insert(0, recent_noise_keys.pop(i))
+            return key
+    recent_noise_keys.insert(0, params)
+    del recent_noise_keys[NOISE_CACHE_SIZE:]
+    return params
+
+
+def build_noise_model(key: NoiseKey) -> NoiseModel:
+    T1_us, T2_us, p1q, p2q, p0to1, p1to0 = key
     noise = NoiseModel()
 
     gate_time_1q = 0.05
     gate_time_2q = 0.25
 
-    tr_1q = thermal_relaxation_error(s.T1_us, s.T2_us, gate_time_1q)
-    tr_2q = thermal_relaxation_error(s.T1_us, s.T2_us, gate_time_2q)
+    tr_1q = thermal_relaxation_error(T1_us, T2_us, gate_time_1q)
+    tr_2q = thermal_relaxation_error(T1_us, T2_us, gate_time_2q)
 
-    dep1 = depolarizing_error(s.p1q, 1)
-    dep2 = depolarizing_error(s.p2q, 2)
+    dep1 = depolarizing_error(p1q, 1)
+    dep2 = depolarizing_error(p2q, 2)
 
     err_1q = tr_1q.compose(dep1)
     err_2q = tr_2q.compose(dep2)
@@ -106,18 +216,69 @@ def build_noise_model(s: HWState) -> NoiseModel:
 
     noise.add_all_qubit_quantum_error(err_2q, "cx")
 
-    ro = ReadoutError([[1.0 - s.p0to1, s.p0to1], [s.p1to0, 1.0 - s.p1to0]])
+    ro = ReadoutError([[1.0 - p0to1, p0to1], [p1to0, 1.0 - p1to0]])
     noise.add_all_qubit_readout_error(ro)
 
     return noise
 
-def run_counts(sim: AerSimulator, qc: QuantumCircuit, shots: int) -> Dict[str, int]:
-    job = sim.run(qc, shots=shots)
-    result = job.result()
-    return result.get_counts(0)
 
+@lru_cache(maxsize=NOISE_CACHE_SIZE)
+def get_simulator(key: NoiseKey) -> AerSimulator:
+    return AerSimulator(noise_model=build_noise_model(key), method="density_matrix", precision="single")
+
+
+@lru_cache(maxsize=NOISE_CACHE_SIZE)
+def get_relaxation_pass(T1_us: float, T2_us: float) -> RelaxationNoisePass:
+    # idle time is a single delay per circuit; this attaches one thermal
+    # relaxation channel sized to each delay's duration instead of a per-gate error
+    return RelaxationNoisePass(
+        t1s=[T1_us * 1e-6] * 2,
+        t2s=[T2_us * 1e-6] * 2,
+        op_types=[Delay],
+    )
+
+
+@dataclass
+class Experiment:
+    circuits: List[QuantumCircuit]
+    # None runs the circuits once and reads their saved probabilities; an int
+    # samples that many shots and hands back measured frequencies instead
+    shots: Optional[int]
+    analyze: Callable[[List[np.ndarray]], float]
+
+
+def counts_to_probs(counts: Dict[str, int], num_clbits: int) -> np.ndarray:
+    # raw experiment counts are keyed by hex outcome, so index them directly
+    # rather than going through get_counts' bitstring formatting
+    probs = np.zeros(2 ** num_clbits)
+    for outcome, n in counts.items():
+        probs[int(outcome, 16)] += n
+    return probs / probs.sum()
+
+
+def run_experiments(sim: AerSimulator, experiments: List[Experiment]) -> List[float]:
+    groups: Dict[Optional[int], List[Tuple[int, int]]] = {}
+    circuits: Dict[Optional[int], List[QuantumCircuit]] = {}
+    for ei, exp in enumerate(experiments):
+        for ci, qc in enumerate(exp.circuits):
+            groups.setdefault(exp.shots, []).append((ei, ci))
+            circuits.setdefault(exp.shots, []).append(qc)
+
+    outputs: List[List[np.ndarray]] = [[None] * len(exp.circuits) for exp in experiments]
+    for shots, index in groups.items():
+        if shots is None:
+            result = sim.run(circuits[shots], shots=1).result()
+            for i, (ei, ci) in enumerate(index):
+                outputs[ei][ci] = np.asarray(result.data(i)["probabilities"], dtype=float)
+        else:
+            result = sim.run(circuits[shots], shots=shots).result()
+            for i, (ei, ci) in enumerate(index):
+                outputs[ei][ci] = counts_to_probs(result.data(i)["counts"], circuits[shots][i].num_clbits)
+
+    return [exp.analyze(out) for exp, out in zip(experiments, outputs)]
 
-def estimate_readout_error(sim: AerSimulator, shots: int = 2000) -> float:
+
+def build_readout_circuits() -> List[QuantumCircuit]:
     qc0 = QuantumCircuit(1, 1)
     qc0.measure(0, 0)
 
@@ -125,184 +286,278 @@ def estimate_readout_error(sim: AerSimulator, shots: int = 2000) -> float:
     qc1.x(0)
     qc1.measure(0, 0)
 
-    c0 = run_counts(sim, qc0, shots)
-    c1 = run_counts(sim, qc1, shots)
-
-    p0_meas1 = c0.get("1", 0) / shots
-    p1_meas0 = c1.get("0", 0) / shots
-    return 100.0 * 0.5 * (p0_meas1 + p1_meas0)
+    return [qc0, qc1]
 
 
-def estimate_T1(sim: AerSimulator, taus_us: np.ndarray, shots: int = 1500) -> float:
-    probs1 = []
+def build_t1_circuits(taus_us: np.ndarray) -> List[QuantumCircuit]:
+    circuits = []
     for tau in taus_us:
-        qc = QuantumCircuit(1, 1)
+        qc = QuantumCircuit(1)
         qc.x(0)
+        qc.delay(int(round(tau * 1000)), 0, unit="ns")
+        qc.save_probabilities([0])
+        circuits.append(qc)
+    return circuits
 
-        N = max(1, int(round(tau / 0.5)))
-        for _ in range(N):
-            qc.id(0)
 
-        qc.measure(0, 0)
-        counts = run_counts(sim, qc, shots)
-        p1 = counts.get("1", 0) / shots
-        probs1.append(p1)
+def build_t2_ramsey_circuits(taus_us: np.ndarray) -> List[QuantumCircuit]:
+    circuits = []
+    for tau in taus_us:
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        qc.delay(int(round(tau * 1000)), 0, unit="ns")
+        qc.rz(RAMSEY_W * tau, 0)
+        qc.h(0)
+        qc.save_probabilities([0])
+        circuits.append(qc)
+    return circuits
 
-    y = np.array(probs1)
 
-    p0 = [max(1e-3, y[0] - y[-1]), max(10.0, float(np.median(taus_us))), y[-1]]
-    try:
-        popt, _ = curve_fit(exp_decay, taus_us, y, p0=p0, maxfev=5000)
-        T1 = float(abs(popt[1]))
-    except Exception:
-        T1 = float(np.nan)
+def build_rb_1q_circuits(depths: np.ndarray, reps: int) -> List[QuantumCircuit]:
+    rng = np.random.default_rng(12345)
+    max_depth = int(depths.max())
+    # rep r at depth m replays the first m layers of row r
+    gate_idx = rng.integers(0, 5, size=(reps, max_depth), dtype=np.int8)
+    rz_ang = rng.standard_normal(size=(reps, max_depth))
 
-    return T1
+    circuits = []
+    for m in depths:
+        for r in range(reps):
+            qc = QuantumCircuit(1)
+            for k in range(int(m)):
+                g = gate_idx[r, k]
+                if g == 0:
+                    qc.h(0)
+                elif g == 1:
+                    qc.s(0)
+                elif g == 2:
+                    qc.x(0)
+                elif g == 3:
+                    qc.sx(0)
+                else:
+                    qc.rz(float(rz_ang[r, k]), 0)
+            qc.save_probabilities([0])
+            circuits.append(qc)
+    return circuits
+
+
+def build_rb_2q_circuits(depths: np.ndarray, reps: int) -> List[QuantumCircuit]:
+    rng = np.random.default_rng(54321)
+    max_depth = int(depths.max())
+    gate_idx = rng.integers(0, 4, size=(reps, max_depth, 2), dtype=np.int8)
+    rz_ang = rng.standard_normal(size=(reps, max_depth, 2))
+    entangle = rng.random(size=(reps, max_depth)) < 0.55
 
+    circuits = []
+    for m in depths:
+        for r in range(reps):
+            qc = QuantumCircuit(2)
+            for k in range(int(m)):
+                for q in [0, 1]:
+                    g = gate_idx[r, k, q]
+                    if g == 0:
+                        qc.h(q)
+                    elif g == 1:
+                        qc.sx(q)
+                    elif g == 2:
+                        qc.x(q)
+                    else:
+                        qc.rz(float(rz_ang[r, k, q]), q)
+                if entangle[r, k]:
+                    qc.cx(0, 1)
+            qc.save_probabilities([0, 1])
+            circuits.append(qc)
+    return circuits
+
+
+TAUS_US = np.array([0.5, 1.0, 2.0, 4.0, 7.0, 10.0, 14.0, 18.0, 24.0, 30.0], dtype=float)
+RAMSEY_W = 2 * math.pi * 0.06
+
+RB_DEPTHS_1Q = np.array([1, 2, 4, 8, 12, 16, 20], dtype=float)
+RB_DEPTHS_2Q = np.array([1, 2, 3, 4, 6, 8, 10], dtype=float)
+RB_REPS_1Q = 12
+RB_REPS_2Q = 10
+
+# transpiled once; gate and readout noise live on the simulator, and only the delay
+# relaxation that get_circuits attaches to the T1/Ramsey sets depends on T1/T2
+BASE_CIRCUITS: Dict[str, List[QuantumCircuit]] = {
+    name: transpile(circs, AerSimulator(method="density_matrix"), optimization_level=0)
+    for name, circs in {
+        "readout": build_readout_circuits(),
+        "t1": build_t1_circuits(TAUS_US),
+        "t2": build_t2_ramsey_circuits(TAUS_US),
+        "rb1q": build_rb_1q_circuits(RB_DEPTHS_1Q, RB_REPS_1Q),
+        "rb2q": build_rb_2q_circuits(RB_DEPTHS_2Q, RB_REPS_2Q),
+    }.items()
+}
+
+# the only sets containing Delay instructions, and so the only ones the relaxation pass touches
+DELAY_CIRCUITS = ("t1", "t2")
+
+
+@lru_cache(maxsize=NOISE_CACHE_SIZE)
+def get_circuits(T1_us: float, T2_us: float) -> Dict[str, List[QuantumCircuit]]:
+    relax = get_relaxation_pass(T1_us, T2_us)
+    circuits = dict(BASE_CIRCUITS)
+    for name in DELAY_CIRCUITS:
+        circuits[name] = [relax(qc) for qc in BASE_CIRCUITS[name]]
+    return circuits
+
+
+def estimate_readout_error(circuits: List[QuantumCircuit], shots: int = 2000) -> Experiment:
+    def analyze(probs: List[np.ndarray]) -> float:
+        p0_meas1 = probs[0][1]
+        p1_meas0 = probs[1][0]
+        return 100.0 * 0.5 * (p0_meas1 + p1_meas0)
+
+    return Experiment(circuits, shots, analyze)
+
+
+def adaptive_tau_index(taus_us: np.ndarray, T_prev: Optional[float], min_points: int, floor: float = 0.5) -> np.ndarray:
+    # drop taus past the point where the last fitted decay predicts less than `floor` of
+    # the signal is left; with exact probabilities the early points pin the fit, and on
+    # this 30 us grid a 0.5 floor starts trimming once T drops below ~43 us
+    if T_prev is None or not np.isfinite(T_prev):
+        return np.arange(len(taus_us))
+    keep = np.exp(-taus_us / T_prev) >= floor
+    keep[:min_points] = True
+    return np.flatnonzero(keep)
+
+
+def estimate_T1(circuits: List[QuantumCircuit], taus_us: np.ndarray, T1_prev: Optional[float] = None) -> Experiment:
+    idx = adaptive_tau_index(taus_us, T1_prev, min_points=4)
+    circuits = [circuits[i] for i in idx]
+    taus_us = taus_us[idx]
+
+    def analyze(probs: List[np.ndarray]) -> float:
+        y = np.stack(probs)[:, 1]
+
+        if y.min() > 1e-6:
+            _, T1, _ = fit_exp_decay_loglinear(taus_us, y)
+            if np.isfinite(T1):
+                return T1
+
+        p0 = [max(1e-3, y[0] - y[-1]), max(10.0, float(np.median(taus_us))), y[-1]]
+        try:
+            popt = fit_least_squares(exp_decay, exp_decay_jac, taus_us, y, p0, max_nfev=2000)
+            T1 = float(abs(popt[1]))
+        except Exception:
+            T1 = float(np.nan)
+
+        return T1
+
+    return Experiment(circuits, None, analyze)
+
+
+def estimate_T2_ramsey(circuits: List[QuantumCircuit], taus_us: np.ndarray, T2_prev: Optional[float] = None) -> Experiment:
+    idx = adaptive_tau_index(taus_us, T2_prev, min_points=6)
+    circuits = [circuits[i] for i in idx]
+    taus_us = taus_us[idx]
+
+    def analyze(probs: List[np.ndarray]) -> float:
+        y = np.stack(probs)[:, 0]
+
+        a0 = (y.max() - y.min()) / 2
+        c0 = y.mean()
+        # the median of a trimmed sweep (~10 us) is a poor start for T2 ~ 40 us
+        T20 = T2_prev if T2_prev is not None and np.isfinite(T2_prev) else max(10.0, float(np.median(taus_us)))
+        w0 = dominant_angular_freq(taus_us, y) if a0 > 1e-6 else RAMSEY_W
+        phi0 = 0.0
+        p0 = [a0, T20, w0, phi0, c0]
 
-def estimate_T2_ramsey(sim: AerSimulator, taus_us: np.ndarray, shots: int = 1500) -> float:
-    w = 2 * math.pi * 0.06
-    probs0 = []
-    for tau in taus_us:
-        qc = QuantumCircuit(1, 1)
-        qc.h(0)
+        try:
+            # keep T2 positive so trial steps can't blow up exp(-t / T2)
+            bounds = ([-np.inf, 1e-3, -np.inf, -np.inf, -np.inf], np.inf)
+            popt = fit_least_squares(damped_cos, damped_cos_jac, taus_us, y, p0, max_nfev=2000, bounds=bounds)
+            T2 = float(abs(popt[1]))
+        except Exception:
+            T2 = float(np.nan)
 
-        N = max(1, int(round(tau / 0.5)))
-        for _ in range(N):
-            qc.id(0)
+        return T2
+
+    return Experiment(circuits, None, analyze)
 
-        qc.rz(w * tau, 0)
-        qc.h(0)
-        qc.measure(0, 0)
 
-        counts = run_counts(sim, qc, shots)
-        p0 = counts.get("0", 0) / shots
-        probs0.append(p0)
+def rb_model(m, A, p, B):
+    return A * (p ** m) + B
 
-    y = np.array(probs0)
 
-    a0 = (y.max() - y.min()) / 2
-    c0 = y.mean()
-    T20 = max(10.0, float(np.median(taus_us)))
-    w0 = w
-    phi0 = 0.0
-    p0 = [a0, T20, w0, phi0, c0]
+def estimate_rb_fidelity_1q(circuits: List[QuantumCircuit], depths: np.ndarray) -> Experiment:
+    def analyze(probs: List[np.ndarray]) -> float:
+        p0s = np.stack(probs)[:, 0].reshape(len(depths), -1)
+        y = p0s.mean(axis=1)
 
-    try:
-        popt, _ = curve_fit(damped_cos, taus_us, y, p0=p0, maxfev=8000)
-        T2 = float(abs(popt[1]))
-    except Exception:
-        T2 = float(np.nan)
+        p0 = [0.5, 0.995, 0.5]
+        try:
+            popt, _ = curve_fit(rb_model, depths, y, p0=p0, bounds=([-1, 0, -1], [2, 1, 2]), maxfev=8000)
+            p = float(popt[1])
+            F = 1.0 - (1.0 - p) / 2.0
+            return 100.0 * F
+        except Exception:
+            return float(np.nan)
 
-    return T2
+    return Experiment(circuits, None, analyze)
 
 
-def estimate_rb_fidelity_1q(sim: AerSimulator, depths: np.ndarray, shots: int = 1000) -> float:
-    rng = np.random.default_rng(12345)
+def estimate_rb_fidelity_2q(circuits: List[QuantumCircuit], depths: np.ndarray) -> Experiment:
+    def analyze(probs: List[np.ndarray]) -> float:
+        p00s = np.stack(probs)[:, 0].reshape(len(depths), -1)
+        y = p00s.mean(axis=1)
 
-    def rand_1q_layer(qc: QuantumCircuit):
-        r = rng.integers(0, 5)
-        if r == 0:
-            qc.h(0)
-        elif r == 1:
-            qc.s(0)
-        elif r == 2:
-            qc.x(0)
-        elif r == 3:
-            qc.sx(0)
-        else:
-            qc.rz(float(rng.normal(0, 1.0)), 0)
+        p0 = [0.5, 0.99, 0.25]
+        try:
+            popt, _ = curve_fit(rb_model, depths, y, p0=p0, bounds=([-1, 0, -1], [2, 1, 2]), maxfev=8000)
+            p = float(popt[1])
+            F = 1.0 - 0.75 * (1.0 - p)
+            return 100.0 * F
+        except Exception:
+            return float(np.nan)
 
-    surv = []
-    for m in depths:
-        reps = 12
-        p0s = []
-        for _ in range(reps):
-            qc = QuantumCircuit(1, 1)
-            for _ in range(int(m)):
-                rand_1q_layer(qc)
-            qc.measure(0, 0)
-            counts = run_counts(sim, qc, shots)
-            p0s.append(counts.get("0", 0) / shots)
-        surv.append(float(np.mean(p0s)))
-
-    y = np.array(surv)
-
-    def rb_model(m, A, p, B):
-        return A * (p ** m) + B
-
-    p0 = [0.5, 0.995, 0.5]
-    try:
-        popt, _ = curve_fit(rb_model, depths, y, p0=p0, bounds=([-1, 0, -1], [2, 1, 2]), maxfev=8000)
-        p = float(popt[1])
-        F = 1.0 - (1.0 - p) / 2.0
-        return 100.0 * F
-    except Exception:
-        return float(np.nan)
-
-
-def estimate_rb_fidelity_2q(sim: AerSimulator, depths: np.ndarray, shots: int = 800) -> float:
-    rng = np.random.default_rng(54321)
+    return Experiment(circuits, None, analyze)
 
-    def rand_layer(qc: QuantumCircuit):
-        for q in [0, 1]:
-            r = rng.integers(0, 4)
-            if r == 0:
-                qc.h(q)
-            elif r == 1:
-                qc.sx(q)
-            elif r == 2:
-                qc.x(q)
-            else:
-                qc.rz(float(rng.normal(0, 1.0)), q)
-        if rng.random() < 0.55:
-            qc.cx(0, 1)
-
-    surv = []
-    for m in depths:
-        reps = 10
-        p00s = []
-        for _ in range(reps):
-            qc = QuantumCircuit(2, 2)
-            for _ in range(int(m)):
-                rand_layer(qc)
-            qc.measure([0, 1], [0, 1])
-            counts = run_counts(sim, qc, shots)
-            p00s.append(counts.get("00", 0) / shots)
-        surv.append(float(np.mean(p00s)))
-
-    y = np.array(surv)
-
-    def rb_model(m, A, p, B):
-        return A * (p ** m) + B
-
-    p0 = [0.5, 0.99, 0.25]
-    try:
-        popt, _ = curve_fit(rb_model, depths, y, p0=p0, bounds=([-1, 0, -1], [2, 1, 2]), maxfev=8000)
-        p = float(popt[1])
-        F = 1.0 - 0.75 * (1.0 - p)
-        return 100.0 * F
-    except Exception:
-        return float(np.nan)
-
-app = FastAPI()
 state = init_state()
 
+# last reported T1/T2, used to trim the next tick's tau sweeps
+last_fit: Dict[str, float] = {}
+
 def make_point(s: HWState) -> Dict:
-    noise = build_noise_model(s)
-    sim = AerSimulator(noise_model=noise)
+    key = noise_key(s)
+    sim = get_simulator(key)
+    circuits = get_circuits(float(s.T1_us), float(s.T2_us))
+
+    t1, t2, readout, f1, f2 = run_experiments(sim, [
+        estimate_T1(circuits["t1"], TAUS_US, last_fit.get("t1")),
+        estimate_T2_ramsey(circuits["t2"], TAUS_US, last_fit.get("t2")),
+        estimate_readout_error(circuits["readout"], shots=2000),
+        estimate_rb_fidelity_1q(circuits["rb1q"], RB_DEPTHS_1Q),
+        estimate_rb_fidelity_2q(circuits["rb2q"], RB_DEPTHS_2Q),
+    ])
+
+    # raw fits, before finalize_point clamps them or substitutes the true params; a
+    # failed fit clears the entry so the next tick runs the full sweep
+    for name, value in (("t1", t1), ("t2", t2)):
+        if np.isfinite(value):
+            last_fit[name] = float(value)
+        else:
+            last_fit.pop(name, None)
+
+    return finalize_point(s, t1, t2, f1, f2, readout)
 
-    taus = np.array([0.5, 1.0, 2.0, 4.0, 7.0, 10.0, 14.0, 18.0, 24.0, 30.0], dtype=float)
 
-    d1 = np.array([1, 2, 4, 8, 12, 16, 20], dtype=float)
-    d2 = np.array([1, 2, 3, 4, 6, 8, 10], dtype=float)
+def make_point_fast(s: HWState) -> Dict:
+    # closed-form values from the hardware params plus a little jitter; no circuits are
+    # simulated. T1/T2/readout track the full estimators, but the gate fidelities are the
+    # nominal 1 - p values: full-mode RB clamps gate1q to 98.0 and reads gate2q ~0.8 lower
+    n = rng.standard_normal(5)
+    t1 = s.T1_us + 1.5 * n[0]
+    t2 = s.T2_us + 1.5 * n[1]
+    f1 = 100.0 * (1.0 - s.p1q) + 0.01 * n[2]
+    f2 = 100.0 * (1.0 - s.p2q) + 0.05 * n[3]
+    readout = 50.0 * (s.p0to1 + s.p1to0) + 0.1 * n[4]
+    return finalize_point(s, t1, t2, f1, f2, readout)
 
-    t1 = estimate_T1(sim, taus, shots=1200)
-    t2 = estimate_T2_ramsey(sim, taus, shots=1200)
-    readout = estimate_readout_error(sim, shots=2000)
-    f1 = estimate_rb_fidelity_1q(sim, d1, shots=900)
-    f2 = estimate_rb_fidelity_2q(sim, d2, shots=700)
 
+def finalize_point(s: HWState, t1: float, t2: float, f1: float, f2: float, readout: float) -> Dict:
     now_ms = int(time.time() * 1000)
     label = time.strftime("%H:%M:%S")
 
@@ -335,15 +590,72 @@ def make_point(s: HWState) -> Dict:
     }
 
 
+# one producer steps the state each tick and fans the serialized point out to every
+# open stream; keyed by whether the stream asked for full circuit simulation
+subscribers: Dict[bool, Set[asyncio.Queue]] = {False: set(), True: set()}
+latest_payload: Dict[bool, Optional[str]] = {False: None, True: None}
+
+
+async def produce_points():
+    global state
+    while True:
+        if any(subscribers.values()):
+            try:
+                state = step_state(state, dt_s=2.0)
+            except Exception:
+                logger.exception("failed to step hardware state")
+            for full, queues in subscribers.items():
+                if not queues:
+                    continue
+                # a bad tick in one mode must not kill the shared producer or starve the other mode
+                try:
+                    point = await asyncio.to_thread(make_point, state) if full else make_point_fast(state)
+                    if not queues:
+                        # everyone left while the point was computed; don't keep it for replay
+                        continue
+                    latest_payload[full] = json.dumps(point)
+                    for queue in list(queues):
+                        if queue.full():
+                            queue.get_nowait()
+                        queue.put_nowait(latest_payload[full])
+                except Exception:
+                    logger.exception("failed to produce %s point", "full" if full else "fast")
+        await asyncio.sleep(2.0)
+
+
+def log_producer_exit(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("point producer stopped", exc_info=task.exception())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    producer = asyncio.create_task(produce_points())
+    producer.add_done_callback(log_producer_exit)
+    try:
+        yield
+    finally:
+        producer.cancel()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
 @app.get("/stream")
-def stream():
-    def event_gen():
-        global state
-        while True:
-            state = step_state(state, dt_s=2.0)
-            point = make_point(state)
-            payload = json.dumps(point)
-            yield f"data: {payload}\n\n"
-            time.sleep(2.0)
+async def stream(full: bool = False):
+    async def event_gen():
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        if latest_payload[full] is not None:
+            queue.put_nowait(latest_payload[full])
+        subscribers[full].add(queue)
+        try:
+            while True:
+                payload = await queue.get()
+                yield f"data: {payload}\n\n"
+        finally:
+            subscribers[full].discard(queue)
+            if not subscribers[full]:
+                # the producer idles without subscribers, so this point would be stale on reconnect
+                latest_payload[full] = None
 
     return StreamingResponse(event_gen(), media_type="text/event-stream")